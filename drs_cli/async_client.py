@@ -0,0 +1,308 @@
+"""Class implementing asynchronous DRS client."""
+
+import asyncio
+import logging
+from types import TracebackType
+from typing import (Dict, Iterable, List, Optional, Tuple, Type, Union)
+from urllib.parse import quote
+
+import aiohttp
+import pydantic
+import requests
+
+from drs_cli.client import _BaseDRSClient
+from drs_cli.models import (AccessURL, DrsObject, Error, PostDrsObject)
+from drs_cli.errors import InvalidObjectData
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncDRSClient(_BaseDRSClient):
+    """Asynchronous client to communicate with a GA4GH DRS instance, based on
+    `aiohttp`. Supports the same endpoints as `DRSClient`, and in addition
+    the concurrent retrieval of multiple DRS objects via `get_objects()`.
+
+    The client is meant to be used as an asynchronous context manager, e.g.:
+
+        async with AsyncDRSClient(uri="https://my-drs.app") as client:
+            objects = await client.get_objects(object_ids=["A3SF4B", "B44FG9"])
+
+    Arguments and attributes are the same as for `DRSClient`.
+    """
+    __slots__ = ('_session',)
+
+    def __init__(
+        self,
+        uri: str,
+        port: Optional[int] = None,
+        base_path: Optional[str] = 'ga4gh/drs/v1',
+        use_http: bool = False,
+        token: Optional[str] = None,
+        cache_ttl: int = 0,
+    ) -> None:
+        """Class constructor."""
+        super().__init__(
+            uri=uri,
+            port=port,
+            base_path=base_path,
+            use_http=use_http,
+            token=token,
+            cache_ttl=cache_ttl,
+        )
+        # session is created once a running event loop is available
+        self._session: Optional[aiohttp.ClientSession] = None
+
+    def __enter__(self) -> 'AsyncDRSClient':
+        raise TypeError(
+            "Use 'async with' instead of 'with' for AsyncDRSClient."
+        )
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        pass
+
+    async def __aenter__(self) -> 'AsyncDRSClient':
+        self._open()
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def get_object(
+        self,
+        object_id: str,
+        token: Optional[str] = None,
+    ) -> Union[Error, DrsObject]:
+        """Retrieve DRS object.
+
+        Cf. `DRSClient.get_object()`.
+        """
+        obj_id = self._get_object_id(object_id=object_id)
+        url = f"{self._objects_url}/{obj_id}"
+        logger.info(f"Request URL: {url}")
+        if token and token != self.token:
+            self.set_token(token=token)
+        cached = self._get_cached(url=url)
+        if cached is not None:
+            return cached
+        response_val = await self._fetch(
+            method='GET',
+            url=url,
+            success_model=DrsObject,
+        )
+        if isinstance(response_val, DrsObject):
+            logger.info(f"Retrieved object: {object_id}")
+            self._set_cached(url=url, response=response_val)
+        return response_val
+
+    async def get_objects(
+        self,
+        object_ids: Iterable[str],
+        token: Optional[str] = None,
+        concurrency: int = 20,
+    ) -> List[Union[Error, DrsObject, Exception]]:
+        """Retrieve multiple DRS objects concurrently.
+
+        Arguments:
+            object_ids: Implementation-specific DRS identifiers OR
+                hostname-based DRS URIs pointing to the objects to retrieve.
+            token: Bearer token for authentication. Set if required by DRS
+                implementation and if not provided when instatiating client or
+                if expired.
+            concurrency: Maximum number of requests in flight at any time.
+
+        Returns:
+            List of responses, in the order of `object_ids`, as returned by
+            `get_object()`. Exceptions raised for individual objects are
+            returned in place of the corresponding response, rather than
+            raised.
+
+        Raises:
+            ValueError: `concurrency` is smaller than 1.
+        """
+        if concurrency < 1:
+            raise ValueError("Concurrency must be at least 1.")
+        if token and token != self.token:
+            self.set_token(token=token)
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _get_object(object_id: str) -> Union[Error, DrsObject]:
+            async with semaphore:
+                return await self.get_object(object_id=object_id)
+
+        return await asyncio.gather(
+            *(_get_object(object_id) for object_id in object_ids),
+            return_exceptions=True,
+        )
+
+    async def get_access_url(
+        self,
+        object_id: str,
+        access_id: str,
+        token: Optional[str] = None,
+    ) -> Union[AccessURL, Error]:
+        """Retrieve access URL of DRS object.
+
+        Cf. `DRSClient.get_access_url()`.
+        """
+        obj_id = self._get_object_id(object_id=object_id)
+        acc_id = quote(string=access_id, safe='')
+        url = f"{self._objects_url}/{obj_id}/access/{acc_id}"
+        logger.info(f"Request URL: {url}")
+        if token and token != self.token:
+            self.set_token(token=token)
+        cached = self._get_cached(url=url)
+        if cached is not None:
+            return cached
+        response_val = await self._fetch(
+            method='GET',
+            url=url,
+            success_model=AccessURL,
+        )
+        if isinstance(response_val, AccessURL):
+            logger.info(f"Retrieved access URL: {response_val.url}")
+            self._set_cached(url=url, response=response_val)
+        return response_val
+
+    async def post_object(
+        self,
+        object_data: Dict,
+        token: Optional[str] = None,
+    ) -> Union[str, Error]:
+        """Register DRS object.
+
+        Cf. `DRSClient.post_object()`.
+        """
+        url = self._objects_url
+        logger.info(f"Request URL: {url}")
+        if token and token != self.token:
+            self.set_token(token=token)
+        try:
+            payload = self._dump_model(
+                model=PostDrsObject.parse_obj(object_data),
+            )
+        except pydantic.ValidationError:
+            raise InvalidObjectData(
+                "Object data could not be validated against API schema."
+            )
+        response_val = await self._fetch(
+            method='POST',
+            url=url,
+            data=payload,
+        )
+        if not isinstance(response_val, Error):
+            logger.info(f"Object registered: {response_val}")
+            self._clear_cache()
+        return response_val
+
+    async def delete_object(
+        self,
+        object_id: str,
+        token: Optional[str] = None,
+    ) -> Union[str, Error]:
+        """Delete DRS object.
+
+        Cf. `DRSClient.delete_object()`.
+        """
+        obj_id = self._get_object_id(object_id=object_id)
+        url = f"{self._objects_url}/{obj_id}"
+        logger.info(f"Request URL: {url}")
+        if token and token != self.token:
+            self.set_token(token=token)
+        response_val = await self._fetch(
+            method='DELETE',
+            url=url,
+        )
+        if not isinstance(response_val, Error):
+            logger.info(f"Object deleted: {object_id}")
+            self._clear_cache()
+        return response_val
+
+    def _open(self) -> aiohttp.ClientSession:
+        """Open session with pooled connections, if not already open.
+
+        Returns:
+            Open session.
+        """
+        if self._session is None:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=100,
+                    limit_per_host=20,
+                    keepalive_timeout=30,
+                ),
+            )
+        return self._session
+
+    async def _fetch(
+        self,
+        method: str,
+        url: str,
+        success_model: Optional[Type[pydantic.BaseModel]] = None,
+        **kwargs,
+    ) -> Union[str, Error, pydantic.BaseModel]:
+        """Send request and unmarshal response.
+
+        Cf. `DRSClient._fetch()`.
+        """
+        status, body = await self._send(
+            method=method,
+            url=url,
+            **kwargs,
+        )
+        return self._parse_response(
+            status_code=status,
+            content=body,
+            success_model=success_model,
+        )
+
+    async def _send(
+        self,
+        method: str,
+        url: str,
+        **kwargs,
+    ) -> Tuple[int, bytes]:
+        """Send request and read response.
+
+        Arguments:
+            method: HTTP method.
+            url: Request URL.
+            **kwargs: Additional arguments passed to
+                `aiohttp.ClientSession.request()`.
+
+        Returns:
+            Tuple of response status code and response body.
+
+        Raises:
+            requests.exceptions.ConnectionError: A connection to the provided
+                DRS instance could not be established.
+        """
+        try:
+            # `aiohttp.ClientSession` does not expose default headers before
+            # version 3.7, so headers are passed along with each request
+            async with self._open().request(
+                method=method,
+                url=url,
+                headers=self.headers,
+                **kwargs,
+            ) as response:
+                return (response.status, await response.read())
+        except aiohttp.ClientConnectionError:
+            raise requests.exceptions.ConnectionError(
+                "Could not connect to API endpoint."
+            )
@@ -1,29 +1,408 @@
 """Class implementing DRS client."""
 
-import json
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import logging
 import re
 import requests
+from requests.adapters import HTTPAdapter
 import socket
-import sys
-from typing import (Dict, Optional, Tuple, Union)
+import ssl
+import threading
+from types import TracebackType
+from typing import (
+    Any,
+    Dict,
+    Iterable,
+    List,
+    MutableMapping,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+)
 from urllib.parse import quote
 import urllib3
+from urllib3.util.retry import Retry
+from urllib3.util.ssl_ import create_urllib3_context
 
 import pydantic
 
 from drs_cli.models import (AccessURL, DrsObject, Error, PostDrsObject)
 from drs_cli.errors import (
-    InvalidObjectData, exception_handler,
+    InvalidObjectData,
+    InvalidObjectIdentifier,
     InvalidResponseError,
     InvalidURI,
 )
 
+try:
+    from cachetools import TTLCache
+except ImportError:
+    TTLCache = None
+
+try:
+    from orjson import dumps as json_dumps
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+    json_dumps = None
+
 logger = logging.getLogger(__name__)
-sys.excepthook = exception_handler
 
 
-class DRSClient():
+@lru_cache(maxsize=None)
+def _get_ssl_context() -> ssl.SSLContext:
+    """Create SSL context with CA certificates loaded, once per process.
+
+    Returns:
+        SSL context shared by all client sessions.
+    """
+    # hostnames are matched by `urllib3`, according to its own settings
+    context = create_urllib3_context()
+    context.load_verify_locations(cafile=requests.utils.DEFAULT_CA_BUNDLE_PATH)
+    return context
+
+
+class _SharedSSLContextAdapter(HTTPAdapter):
+    """HTTP adapter that uses a single, shared SSL context for HTTPS
+    connections with default certificate verification.
+
+    By default, a new SSL context is created and the CA bundle is loaded
+    for every new connection. Sharing a context with the CA certificates
+    preloaded avoids that work when connections are (re-)established. Requests
+    with verification disabled, a custom CA bundle or a client certificate
+    are sent via connections with their own SSL contexts, so that their
+    settings do not leak into the shared context.
+
+    The shared context is set as default for the connection pools of the
+    adapter's pool manager and of its proxy managers. As with the other SSL
+    settings of `requests`, it is then set or unset for a connection pool on
+    every request, in `cert_verify()`.
+    """
+
+    def init_poolmanager(
+        self,
+        connections: int,
+        maxsize: int,
+        block: bool = False,
+        **pool_kwargs,
+    ) -> None:
+        pool_kwargs.setdefault('ssl_context', _get_ssl_context())
+        super().init_poolmanager(
+            connections,
+            maxsize,
+            block=block,
+            **pool_kwargs,
+        )
+
+    def proxy_manager_for(
+        self,
+        proxy: str,
+        **proxy_kwargs,
+    ) -> urllib3.PoolManager:
+        proxy_kwargs.setdefault('ssl_context', _get_ssl_context())
+        return super().proxy_manager_for(proxy, **proxy_kwargs)
+
+    def cert_verify(self, conn: Any, url: str, verify: Any, cert: Any) -> None:
+        super().cert_verify(conn, url, verify, cert)
+        if not url.lower().startswith('https'):
+            return
+        if verify is True and cert is None:
+            conn.conn_kw['ssl_context'] = _get_ssl_context()
+            # default CA certificates are already loaded into shared context
+            conn.ca_certs = None
+            conn.ca_cert_dir = None
+        else:
+            conn.conn_kw.pop('ssl_context', None)
+
+
+class _BaseDRSClient():
+    """Base class of DRS clients, implementing all functionality that does not
+    depend on how requests are sent.
+
+    Cf. `DRSClient` for arguments and attributes.
+    """
+    __slots__ = (
+        'uri',
+        'token',
+        'headers',
+        '_objects_url',
+        '_get_cache',
+        '_cache_lock',
+    )
+
+    # set regular expressions as private class variables; compiled once
+    _RE_DOMAIN_PART = r'[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?'
+    _RE_DOMAIN = rf"(?:{_RE_DOMAIN_PART}\.)+{_RE_DOMAIN_PART}\.?"
+    _DOMAIN_RE = re.compile(_RE_DOMAIN, re.I)
+    # reject overly long URIs and object IDs before parsing them
+    _MAX_URI_LENGTH = 2048
+    _SCHEMAS = ('drs', 'http', 'https')
+
+    def __init__(
+        self,
+        uri: str,
+        port: Optional[int] = None,
+        base_path: Optional[str] = 'ga4gh/drs/v1',
+        use_http: bool = False,
+        token: Optional[str] = None,
+        cache_ttl: int = 0,
+    ) -> None:
+        """Class constructor."""
+        schema, host = self._get_host(uri)
+        if schema == 'drs':
+            schema = 'http' if use_http else 'https'
+        if port is None:
+            port = 80 if schema == 'http' else 443
+        base_path = 'ga4gh/drs/v1' if base_path is None else base_path
+        self.uri = f"{schema}://{host}:{port}/{base_path}"
+        self._objects_url = f"{self.uri}/objects"
+        self.token = token
+        self.headers = self._get_headers()
+        self._get_cache: Optional[MutableMapping] = None
+        if cache_ttl > 0:
+            if TTLCache is None:
+                raise ImportError(
+                    "Caching responses requires 'cachetools', e.g., via "
+                    "'pip install drs_cli[cache]'."
+                )
+            self._get_cache = TTLCache(maxsize=1024, ttl=cache_ttl)
+        self._cache_lock = threading.Lock()
+        logger.info(f"Instantiated client for: {self.uri}")
+
+    def set_token(
+        self,
+        token: Optional[str],
+    ) -> None:
+        """Set bearer token to send along with subsequent requests.
+
+        Request headers are updated in place.
+
+        Arguments:
+            token: Bearer token for authentication. Pass `None` to stop sending
+                an `Authorization` header.
+        """
+        self.token = token
+        if token:
+            self.headers['Authorization'] = f"Bearer {token}"
+        else:
+            self.headers.pop('Authorization', None)
+
+    def _get_cached(
+        self,
+        url: str,
+    ) -> Optional[pydantic.BaseModel]:
+        """Look up cached response for `GET` request.
+
+        Arguments:
+            url: Request URL.
+
+        Returns:
+            Copy of cached response, or `None` if caching is disabled or no
+            response is cached for the URL and the current request headers.
+        """
+        if self._get_cache is None:
+            return None
+        with self._cache_lock:
+            response = self._get_cache.get(self._get_cache_key(url=url))
+        if response is None:
+            return None
+        logger.info(f"Retrieved cached response for: {url}")
+        return response.copy(deep=True)
+
+    def _set_cached(
+        self,
+        url: str,
+        response: pydantic.BaseModel,
+    ) -> None:
+        """Cache response for `GET` request, if caching is enabled.
+
+        A copy of the response is cached, so that changes to the response
+        returned to the caller do not affect later cache hits.
+
+        Arguments:
+            url: Request URL.
+            response: Unmarshalled response.
+        """
+        if self._get_cache is not None:
+            response = response.copy(deep=True)
+            with self._cache_lock:
+                self._get_cache[self._get_cache_key(url=url)] = response
+
+    def _clear_cache(self) -> None:
+        """Drop all cached responses, e.g., after objects were modified."""
+        if self._get_cache is not None:
+            with self._cache_lock:
+                self._get_cache.clear()
+
+    def _get_cache_key(
+        self,
+        url: str,
+    ) -> Tuple[str, Tuple[Tuple[str, str], ...]]:
+        """Build cache key from request URL and headers.
+
+        Arguments:
+            url: Request URL.
+
+        Returns:
+            Tuple of request URL and sorted request headers.
+        """
+        return (url, tuple(sorted(self.headers.items())))
+
+    def _get_headers(self) -> Dict:
+        """Build dictionary of request headers.
+
+        Returns:
+            A dictionary of request headers
+        """
+        headers: Dict = {
+            'Content-type': 'application/json',
+        }
+        if self.token:
+            headers['Authorization'] = 'Bearer ' + self.token
+        return headers
+
+    @staticmethod
+    def _dump_model(
+        model: pydantic.BaseModel,
+    ) -> Union[bytes, str]:
+        """Serialize model to JSON, leaving out fields that were not set.
+
+        JSON is encoded with `orjson`, if available, and with Pydantic's
+        encoder otherwise.
+
+        Arguments:
+            model: Model instance.
+
+        Returns:
+            JSON representation of `model`.
+        """
+        if json_dumps is None:
+            return model.json(exclude_unset=True)
+        return json_dumps(model.dict(exclude_unset=True))
+
+    @staticmethod
+    def _parse_response(
+        status_code: int,
+        content: bytes,
+        success_model: Optional[Type[pydantic.BaseModel]] = None,
+    ) -> Union[str, Error, pydantic.BaseModel]:
+        """Unmarshal response.
+
+        JSON is decoded with `orjson`, if available, and with the standard
+        library `json` module otherwise.
+
+        Arguments:
+            status_code: Response status code.
+            content: Response body.
+            success_model: Model to unmarshal `200` responses into; if not
+                provided, the string representation of the response JSON is
+                returned.
+
+        Returns:
+            Unmarshalled response as an instance of `success_model` (or a
+            string) in case of a `200` response, or an instance of `Error`
+            for all other responses.
+
+        Raises:
+            drs_cli.errors.InvalidResponseError: The response could not be
+                validated against the API schema.
+        """
+        try:
+            data = json_loads(content)
+            if not status_code == 200:
+                logger.warning("Received error response.")
+                return Error.parse_obj(data)
+            if success_model is None:
+                return str(data)
+            return success_model.parse_obj(data)
+        except (
+            pydantic.ValidationError,
+            ValueError,
+        ):
+            raise InvalidResponseError(
+                "Response could not be validated against API schema."
+            )
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _get_host(
+        cls,
+        uri: str,
+    ) -> Tuple[str, str]:
+        """Extract URI schema and domain or IP from HTTP, HTTPS or DRS URI.
+
+        Results are cached.
+
+        Arguments:
+            uri: HTTP or HTTPS URI pointing to the root domain/IP of a DRS
+                instance OR a hostname-based DRS URI to a given object, cf.
+                https://ga4gh.github.io/data-repository-service-schemas/preview/develop/docs/#_hostname_based_drs_uris.
+                Anything after a slash following the domain/IP will be ignored.
+
+        Returns:
+            Tuple of URI schema (e.g., 'https', 'drs') and host domain or IP
+            (e.g., 'my-drs.app', '0.0.0.0').
+
+        Raises:
+            drs_cli.errors.InvalidURI: input URI cannot be parsed.
+
+        Examples:
+           >>> DRSClient._get_host(uri="https://my-drs.app/will-be-ignored")
+           ('https', 'my-drs.app')
+           >>> DRSClient._get_host(uri="drs://my-drs.app/My0bj3ct")
+           ('drs', 'my-drs.app')
+        """
+        if len(uri) > cls._MAX_URI_LENGTH:
+            raise InvalidURI
+        schema, sep, rest = uri.partition('://')
+        schema = schema.lower()
+        if not sep or schema not in cls._SCHEMAS:
+            raise InvalidURI
+        match = cls._DOMAIN_RE.match(rest)
+        if not match or len(match.group()) > 253:
+            raise InvalidURI
+        return (schema, match.group())
+
+    @classmethod
+    @lru_cache(maxsize=1024)
+    def _get_object_id(
+        cls,
+        object_id: str,
+    ) -> str:
+        """Extract and percent-encode DRS identifier.
+
+        Results are cached, as the same objects are often accessed repeatedly.
+
+        Arguments:
+            object_id: Implementation-specific DRS identifier OR hostname-based
+               DRS URI pointing to a given object, cf.
+               https://ga4gh.github.io/data-repository-service-schemas/preview/develop/docs/#_hostname_based_drs_uris.
+               Note that if a DRS URI is passed, only the DRS identifier part
+               will be evaluated. To reset the hostname, create a new client
+               with the `DRSClient()` constructor.
+
+        Returns:
+            Validated, percent-encoded object ID.
+
+        Raises:
+            drs_cli.errors.InvalidObjectIdentifier: input object ID cannot be
+                parsed.
+        """
+        if len(object_id) > cls._MAX_URI_LENGTH:
+            raise InvalidObjectIdentifier
+        if object_id[:6].lower() == 'drs://':
+            host, sep, obj_id = object_id[6:].partition('/')
+            if sep and obj_id and cls._DOMAIN_RE.fullmatch(host):
+                object_id = obj_id
+        # identifiers must be non-empty and must not contain whitespace
+        if object_id.split() != [object_id]:
+            raise InvalidObjectIdentifier
+        return quote(string=object_id, safe='')
+
+
+class DRSClient(_BaseDRSClient):
     """Client to communicate with a GA4GH DRS instance. Supports additional
     endpoints defined in DRS-filer
     (https://github.com/elixir-cloud-aai/drs-filer).
@@ -48,19 +427,26 @@ class DRSClient():
         token: Bearer token to send along with DRS API requests. Set if
             required by DRS implementation. Alternatively, specify in API
             endpoint access methods.
+        cache_ttl: Time in seconds for which successful responses of
+            `get_object()` and `get_access_url()` are cached in memory. Cache
+            entries are specific to the request headers, including the token.
+            Caching is disabled if set to `0` (default).
 
     Attributes:
         uri: URI to DRS endpoints, built from `uri`, `port` and `base_path`,
             e.g.,"https://my-drs.app:443/ga4gh/drs/v1".
         token: Bearer token for gaining access to DRS endpoints.
-        headers: Dictionary of request headers.
+        headers: Dictionary of request headers; the default headers of the
+            underlying session, so that changes apply to subsequent requests.
+
+    Requests are sent through a persistent `requests.Session`, so that
+    connections to the DRS instance are pooled and reused across calls. Call
+    `close()` when done with the client, or use it as a context manager.
     """
-    # set regular expressions as private class variables
-    _RE_DOMAIN_PART = r'[a-z0-9]([a-z0-9-]{1,61}[a-z0-9]?)?'
-    _RE_DOMAIN = rf"({_RE_DOMAIN_PART}\.)+{_RE_DOMAIN_PART}\.?"
-    _RE_DRS_ID = r'\S+'
-    _RE_HOST = rf"^(?P<schema>drs|http|https):\/\/(?P<host>{_RE_DOMAIN})\/?"
-    _RE_OBJECT_ID = rf"^(drs:\/\/{_RE_DOMAIN}\/)?(?P<obj_id>{_RE_DRS_ID})$"
+    __slots__ = ('_session',)
+
+    # read response bodies larger than this many bytes directly from socket
+    _STREAM_THRESHOLD = 100 * 1024
 
     def __init__(
         self,
@@ -69,18 +455,19 @@ class DRSClient():
         base_path: Optional[str] = 'ga4gh/drs/v1',
         use_http: bool = False,
         token: Optional[str] = None,
+        cache_ttl: int = 0,
     ) -> None:
         """Class constructor."""
-        schema, host = self._get_host(uri)
-        if schema == 'drs':
-            schema = 'http' if use_http else 'https'
-        if port is None:
-            port = 80 if schema == 'http' else 443
-        base_path = 'ga4gh/drs/v1' if base_path is None else base_path
-        self.uri = f"{schema}://{host}:{port}/{base_path}"
-        self.token = token
-        self.headers = self._get_headers()
-        logger.info(f"Instantiated client for: {self.uri}")
+        super().__init__(
+            uri=uri,
+            port=port,
+            base_path=base_path,
+            use_http=use_http,
+            token=token,
+            cache_ttl=cache_ttl,
+        )
+        self._session = self._get_session()
+        self.headers = self._session.headers
 
     def get_object(
         self,
@@ -109,45 +496,69 @@ class DRSClient():
                 validated against the API schema.
         """
         obj_id = self._get_object_id(object_id=object_id)
-        url = f"{self.uri}/objects/{obj_id}"
+        url = f"{self._objects_url}/{obj_id}"
         logger.info(f"Request URL: {url}")
-        if token:
-            self.token = token
-            self._get_headers()
-        try:
-            response = requests.get(
-                url=url,
-                headers=self.headers,
-            )
-        except (
-            requests.exceptions.ConnectionError,
-            socket.gaierror,
-            urllib3.exceptions.NewConnectionError,
-        ):
-            raise requests.exceptions.ConnectionError(
-                "Could not connect to API endpoint."
-            )
-        if not response.status_code == 200:
-            try:
-                response_val = Error(**response.json())
-            except (
-                json.decoder.JSONDecodeError,
-                pydantic.ValidationError,
-            ):
-                raise InvalidResponseError(
-                    "Response could not be validated against API schema."
-                )
-            logger.warning("Received error response.")
-        else:
-            try:
-                response_val = DrsObject(**response.json())
-            except pydantic.ValidationError:
-                raise InvalidResponseError(
-                    "Response could not be validated against API schema."
-                )
+        if token and token != self.token:
+            self.set_token(token=token)
+        cached = self._get_cached(url=url)
+        if cached is not None:
+            return cached
+        response_val = self._fetch(
+            method='GET',
+            url=url,
+            success_model=DrsObject,
+        )
+        if isinstance(response_val, DrsObject):
             logger.info(f"Retrieved object: {object_id}")
+            self._set_cached(url=url, response=response_val)
         return response_val
 
+    def get_objects(
+        self,
+        object_ids: Iterable[str],
+        token: Optional[str] = None,
+        max_workers: int = 16,
+    ) -> List[Union[Error, DrsObject, Exception]]:
+        """Retrieve multiple DRS objects concurrently.
+
+        Requests are sent from a pool of threads sharing the client's session.
+        For threads not to compete for connections, `max_workers` should not
+        exceed the session's connection pool size (20).
+
+        Arguments:
+            object_ids: Implementation-specific DRS identifiers OR
+                hostname-based DRS URIs pointing to the objects to retrieve.
+            token: Bearer token for authentication. Set if required by DRS
+                implementation and if not provided when instatiating client or
+                if expired.
+            max_workers: Maximum number of requests in flight at any time.
+
+        Returns:
+            List of responses, in the order of `object_ids`, as returned by
+            `get_object()`. Exceptions raised for individual objects are
+            returned in place of the corresponding response, rather than
+            raised.
+        """
+        if token and token != self.token:
+            self.set_token(token=token)
+        object_ids = list(object_ids)
+        if not object_ids:
+            return []
+        with ThreadPoolExecutor(
+            max_workers=min(len(object_ids), max_workers),
+        ) as executor:
+            futures = [
+                executor.submit(self.get_object, object_id=object_id)
+                for object_id in object_ids
+            ]
+        responses: List[Union[Error, DrsObject, Exception]] = []
+        for future in futures:
+            exception = future.exception()
+            responses.append(
+                future.result() if exception is None else exception
+            )
+        return responses
+
     def get_access_url(
         self,
         object_id: str,
@@ -178,43 +589,21 @@ class DRSClient():
         """
         obj_id = self._get_object_id(object_id=object_id)
         acc_id = quote(string=access_id, safe='')
-        url = f"{self.uri}/objects/{obj_id}/access/{acc_id}"
+        url = f"{self._objects_url}/{obj_id}/access/{acc_id}"
         logger.info(f"Request URL: {url}")
-        if token:
-            self.token = token
-            self._get_headers()
-        try:
-            response = requests.get(
-                url=url,
-                headers=self.headers,
-            )
-        except (
-            requests.exceptions.ConnectionError,
-            socket.gaierror,
-            urllib3.exceptions.NewConnectionError,
-        ):
-            raise requests.exceptions.ConnectionError(
-                "Could not connect to API endpoint."
-            )
-        if not response.status_code == 200:
-            try:
-                response_val = Error(**response.json())
-            except (
-                json.decoder.JSONDecodeError,
-                pydantic.ValidationError,
-            ):
-                raise InvalidResponseError(
-                    "Response could not be validated against API schema."
-                )
-            logger.warning("Received error response.")
-        else:
-            try:
-                response_val = AccessURL(**response.json())
-            except pydantic.ValidationError:
-                raise InvalidResponseError(
-                    "Response could not be validated against API schema."
-                )
+        if token and token != self.token:
+            self.set_token(token=token)
+        cached = self._get_cached(url=url)
+        if cached is not None:
+            return cached
+        response_val = self._fetch(
+            method='GET',
+            url=url,
+            success_model=AccessURL,
+        )
+        if isinstance(response_val, AccessURL):
             logger.info(f"Retrieved access URL: {response_val.url}")
+            self._set_cached(url=url, response=response_val)
         return response_val
 
     def post_object(
@@ -242,50 +631,26 @@ class DRSClient():
             drs_cli.errors.InvalidResponseError: The response could not be
                 validated against the API schema.
         """
-        url = f"{self.uri}/objects"
+        url = self._objects_url
         logger.info(f"Request URL: {url}")
-        if token:
-            self.token = token
-            self._get_headers()
+        if token and token != self.token:
+            self.set_token(token=token)
         try:
-            PostDrsObject(**object_data).dict()
+            payload = self._dump_model(
+                model=PostDrsObject.parse_obj(object_data),
+            )
         except pydantic.ValidationError:
             raise InvalidObjectData(
                 "Object data could not be validated against API schema."
             )
-        try:
-            response = requests.post(
-                url=url,
-                json=object_data,
-                headers=self.headers,
-            )
-        except (
-            requests.exceptions.ConnectionError,
-            socket.gaierror,
-            urllib3.exceptions.NewConnectionError,
-        ):
-            raise requests.exceptions.ConnectionError(
-                "Could not connect to API endpoint."
-            )
-        if not response.status_code == 200:
-            try:
-                response_val = Error(**response.json())
-            except (
-                json.decoder.JSONDecodeError,
-                pydantic.ValidationError,
-            ):
-                raise InvalidResponseError(
-                    "Response could not be validated against API schema."
-                )
-            logger.warning("Received error response.")
-        else:
-            try:
-                response_val = str(response.json())
-            except json.decoder.JSONDecodeError:
-                raise InvalidResponseError(
-                    "Response could not be validated against API schema."
-                )
+        response_val = self._fetch(
+            method='POST',
+            url=url,
+            data=payload,
+        )
+        if not isinstance(response_val, Error):
             logger.info(f"Object registered: {response_val}")
+            self._clear_cache()
         return response_val
 
     def delete_object(
@@ -314,15 +679,60 @@ class DRSClient():
                 validated against the API schema.
         """
         obj_id = self._get_object_id(object_id=object_id)
-        url = f"{self.uri}/objects/{obj_id}"
+        url = f"{self._objects_url}/{obj_id}"
         logger.info(f"Request URL: {url}")
-        if token:
-            self.token = token
-            self._get_headers()
+        if token and token != self.token:
+            self.set_token(token=token)
+        response_val = self._fetch(
+            method='DELETE',
+            url=url,
+        )
+        if not isinstance(response_val, Error):
+            logger.info(f"Object deleted: {object_id}")
+            self._clear_cache()
+        return response_val
+
+    def close(self) -> None:
+        """Close the underlying session and release pooled connections."""
+        self._session.close()
+
+    def __enter__(self) -> 'DRSClient':
+        return self
+
+    def __exit__(
+        self,
+        exc_type: Optional[Type[BaseException]],
+        exc_value: Optional[BaseException],
+        traceback: Optional[TracebackType],
+    ) -> None:
+        self.close()
+
+    def _request(
+        self,
+        method: str,
+        url: str,
+        **kwargs,
+    ) -> requests.Response:
+        """Send request via session.
+
+        Arguments:
+            method: HTTP method.
+            url: Request URL.
+            **kwargs: Additional arguments passed to
+                `requests.Session.request()`.
+
+        Returns:
+            Response object.
+
+        Raises:
+            requests.exceptions.ConnectionError: A connection to the provided
+                DRS instance could not be established.
+        """
         try:
-            response = requests.delete(
+            return self._session.request(
+                method=method,
                 url=url,
-                headers=self.headers,
+                **kwargs,
             )
         except (
             requests.exceptions.ConnectionError,
@@ -332,94 +742,115 @@ class DRSClient():
             raise requests.exceptions.ConnectionError(
                 "Could not connect to API endpoint."
             )
-        if not response.status_code == 200:
-            try:
-                response_val = Error(**response.json())
-            except (
-                json.decoder.JSONDecodeError,
-                pydantic.ValidationError,
-            ):
-                raise InvalidResponseError(
-                    "Response could not be validated against API schema."
-                )
-            logger.warning("Received error response.")
-        else:
-            try:
-                response_val = str(response.json())
-            except json.decoder.JSONDecodeError:
-                raise InvalidResponseError(
-                    "Response could not be validated against API schema."
-                )
-            logger.info(f"Object deleted: {object_id}")
-        return response_val
 
-    def _get_headers(self) -> Dict:
-        """Build dictionary of request headers.
-
-        Returns:
-            A dictionary of request headers
-        """
-        headers: Dict = {
-            'Content-type': 'application/json',
-        }
-        if self.token:
-            headers['Authorization'] = 'Bearer ' + self.token
-        return headers
-
-    def _get_host(
+    def _fetch(
         self,
-        uri: str,
-    ) -> Tuple[str, str]:
-        """Extract URI schema and domain or IP from HTTP, HTTPS or DRS URI.
+        method: str,
+        url: str,
+        success_model: Optional[Type[pydantic.BaseModel]] = None,
+        **kwargs,
+    ) -> Union[str, Error, pydantic.BaseModel]:
+        """Send request and unmarshal response.
 
         Arguments:
-            uri: HTTP or HTTPS URI pointing to the root domain/IP of a DRS
-                instance OR a hostname-based DRS URI to a given object, cf.
-                https://ga4gh.github.io/data-repository-service-schemas/preview/develop/docs/#_hostname_based_drs_uris.
-                Anything after a slash following the domain/IP will be ignored.
+            method: HTTP method.
+            url: Request URL.
+            success_model: Model to unmarshal `200` responses into, cf.
+                `_parse_response()`.
+            **kwargs: Additional arguments passed to `_request()`.
 
         Returns:
-            Tuple of URI schema (e.g., 'https', 'drs') and host domain or IP
-            (e.g., 'my-drs.app', '0.0.0.0').
+            Unmarshalled response, cf. `_parse_response()`.
 
         Raises:
-            drs_cli.errors.InvalidURI: input URI cannot be parsed.
-
-        Examples:
-           >>> DRSClient.get_host(uri="https://my-drs.app/will-be-ignored")
-           ('https', 'my-drs.app')
-           >>> DRSClient.get_host(uri="drs://my-drs.app/My0bj3ct")
-           ('drs', 'my-drs.app')
+            requests.exceptions.ChunkedEncodingError: The response body could
+                not be read completely.
+            requests.exceptions.ConnectionError: A connection to the provided
+                DRS instance could not be established, or reading the response
+                body timed out.
+            requests.exceptions.ContentDecodingError: The response body could
+                not be decoded.
+            drs_cli.errors.InvalidResponseError: The response could not be
+                validated against the API schema.
         """
-        match = re.search(self._RE_HOST, uri, re.I)
-        if match:
-            schema = match.group('schema')
-            host = match.group('host').rstrip('\\')
-            if len(host) > 253:
-                raise InvalidURI
-            return (schema, host)
-        else:
-            raise InvalidURI
+        response = self._request(
+            method=method,
+            url=url,
+            stream=True,
+            **kwargs,
+        )
+        return self._parse_response(
+            status_code=response.status_code,
+            content=self._get_content(response=response),
+            success_model=success_model,
+        )
+
+    @classmethod
+    def _get_content(
+        cls,
+        response: requests.Response,
+    ) -> bytes:
+        """Read body of streamed response.
+
+        Large bodies, as announced via the `Content-Length` header, are read
+        from the underlying `urllib3` response in one go, bypassing the
+        chunk-wise buffering of `requests.Response.content`.
 
-    def _get_object_id(
-        self,
-        object_id: str,
-    ) -> str:
-        """
         Arguments:
-            object_id: Implementation-specific DRS identifier OR hostname-based
-               DRS URI pointing to a given object, cf.
-               https://ga4gh.github.io/data-repository-service-schemas/preview/develop/docs/#_hostname_based_drs_uris.
-               Note that if a DRS URI is passed, only the DRS identifier part
-               will be evaluated. To reset the hostname, create a new client
-               with the `DRSClient()` constructor.
+            response: Response of request sent with `stream=True`.
 
         Returns:
-            Validated, percent-encoded object ID.
+            Response body.
 
         Raises:
-            drs_cli.errors.InvalidObjectIdentifier: input object ID cannot be
-                parsed.
+            requests.exceptions.ChunkedEncodingError: The response body could
+                not be read completely.
+            requests.exceptions.ConnectionError: Reading the response body
+                timed out.
+            requests.exceptions.ContentDecodingError: The response body could
+                not be decoded.
+        """
+        length = response.headers.get('Content-Length', '')
+        if length.isdigit() and int(length) > cls._STREAM_THRESHOLD:
+            # translate errors like `requests.Response.iter_content()` does
+            try:
+                return response.raw.read(decode_content=True)
+            except urllib3.exceptions.ProtocolError as exc:
+                raise requests.exceptions.ChunkedEncodingError(exc)
+            except urllib3.exceptions.DecodeError as exc:
+                raise requests.exceptions.ContentDecodingError(exc)
+            except urllib3.exceptions.ReadTimeoutError as exc:
+                raise requests.exceptions.ConnectionError(exc)
+            finally:
+                response.close()
+        return response.content
+
+    def _get_session(self) -> requests.Session:
+        """Build session with pooled connections and retries.
+
+        All HTTPS connections share a single SSL context.
+
+        Requests that could not be sent because of connection errors are
+        retried with exponential backoff. Once sent, only idempotent `GET` and
+        `DELETE` requests are retried, e.g., when failing with `502`, `503` or
+        `504` responses; `POST` requests are not.
+
+        Returns:
+            Session with request headers set.
         """
-        match = re.search(self._RE_OBJECT_ID, object_id, re.I)
-        return quote(string=match.group('obj_id'), safe='')
+        session = requests.Session()
+        adapter = _SharedSSLContextAdapter(
+            pool_connections=10,
+            pool_maxsize=20,
+            max_retries=Retry(
+                total=5,
+                backoff_factor=0.3,
+                status_forcelist=[502, 503, 504],
+                allowed_methods=frozenset(['GET', 'DELETE']),
+                raise_on_status=False,
+            ),
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        session.headers.update(self.headers)
+        return session
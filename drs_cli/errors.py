@@ -1,4 +1,5 @@
 import logging
+import sys
 from types import TracebackType
 
 logger = logging.getLogger(__name__)
@@ -17,12 +18,25 @@ def exception_handler(
     logger.error(msg)
 
 
+def configure_excepthook() -> None:
+    """Register `exception_handler()` as handler for uncaught exceptions.
+
+    Not done on import, so that importing the client does not modify global
+    interpreter state. Call from application entry points instead.
+    """
+    sys.excepthook = exception_handler
+
+
 class InvalidObjectData(Exception):
     """Exception raised when object data cannot be validated against the API
     schema.
     """
 
 
+class InvalidObjectIdentifier(Exception):
+    """Exception raised for invalid DRS object identifiers."""
+
+
 class InvalidResponseError(Exception):
     """Exception raised when an invalid API response is encountered."""
 
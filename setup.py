@@ -30,5 +30,10 @@ setup(
         'Programming Language :: Python :: 3.8',
     ],
     install_requires=[],
+    extras_require={
+        'async': ['aiohttp'],
+        'cache': ['cachetools'],
+        'orjson': ['orjson'],
+    },
     python_requires='>=3.6'
 )
@@ -0,0 +1,39 @@
+"""Shared fixtures for unit tests."""
+
+import pytest
+import requests_mock
+
+from drs_cli.client import DRSClient
+from tests.mock_data import (
+    MOCK_HOST,
+    MOCK_PORT,
+    MOCK_TOKEN,
+)
+
+
+@pytest.fixture(scope="session")
+def cli():
+    """Client without token."""
+    with DRSClient(uri=MOCK_HOST, port=MOCK_PORT) as cli:
+        yield cli
+
+
+@pytest.fixture(scope="session")
+def cli_t():
+    """Client with token."""
+    with DRSClient(uri=MOCK_HOST, port=MOCK_PORT, token=MOCK_TOKEN) as cli:
+        yield cli
+
+
+@pytest.fixture(scope="module")
+def _mocker():
+    """Mock requests for all tests of a module."""
+    with requests_mock.Mocker() as m:
+        yield m
+
+
+@pytest.fixture
+def mocker(_mocker):
+    """Mock requests, with history of previous tests discarded."""
+    _mocker.reset_mock()
+    return _mocker
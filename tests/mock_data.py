@@ -1,8 +1,5 @@
 """Mock input data for unit tests."""
 
-from copy import deepcopy
-import uuid
-
 # no dependencies
 MOCK_BASE_PATH = "a/b/c"
 MOCK_DRS_URI = "drs://fakehost.com/SOME_OBJECT"
@@ -25,7 +22,7 @@ MOCK_ERROR_MSG = "SYSTEM HANDLER"
 MOCK_ERROR_MSG_CUSTOM_HANDLER = "CUSTOM HANDLER"
 MOCK_FILE_URL = "ftp://my.ftp.service/my_path/my_file_01.txt"
 MOCK_HOST = "https://fakehost.com"
-MOCK_ID = str(uuid.uuid4())
+MOCK_ID = "00000000-0000-0000-0000-000000000001"
 MOCK_PORT = 8080
 MOCK_SELF_URI = f"https://fakehost.com/ga4gh/drs/v1/objects/{MOCK_ID}"
 MOCK_TOKEN = "MyT0k3n"
@@ -50,6 +47,8 @@ MOCK_CHECKSUMS = [
     },
 ]
 MOCK_DRS_URL = f"{MOCK_HOST}:{MOCK_PORT}/ga4gh/drs/v1/objects"
+MOCK_OBJECT_URL = f"{MOCK_DRS_URL}/{MOCK_ID}"
+MOCK_OBJECT_ACCESS_URL = f"{MOCK_OBJECT_URL}/access/{MOCK_ID}"
 MOCK_OBJECT_POST_INVALID = {
     "updated_time": "2019-04-24T05:23:43-06:00",
     "version": "1",
@@ -58,11 +57,22 @@ MOCK_OBJECT_POST_INVALID = {
     "checksums": MOCK_CHECKSUMS,
     "access_methods": MOCK_ACCESS_METHODS,
 }
-MOCK_OBJECT_GET_INVALID = deepcopy(MOCK_OBJECT_POST_INVALID)
-MOCK_OBJECT_GET_INVALID['id'] = MOCK_ID
-MOCK_OBJECT_GET_INVALID['self_uri'] = MOCK_SELF_URI
-MOCK_OBJECT_GET_INVALID['access_methods'][0]['access_id'] = MOCK_ID
-MOCK_OBJECT_POST = deepcopy(MOCK_OBJECT_POST_INVALID)
-MOCK_OBJECT_POST['created_time'] = "2019-05-20T00:12:34-07:00"
-MOCK_OBJECT_GET = deepcopy(MOCK_OBJECT_GET_INVALID)
-MOCK_OBJECT_GET['created_time'] = "2019-05-20T00:12:34-07:00"
+MOCK_OBJECT_GET_INVALID = {
+    **MOCK_OBJECT_POST_INVALID,
+    "id": MOCK_ID,
+    "self_uri": MOCK_SELF_URI,
+    "access_methods": [
+        {
+            **MOCK_ACCESS_METHODS[0],
+            "access_id": MOCK_ID,
+        },
+    ],
+}
+MOCK_OBJECT_POST = {
+    **MOCK_OBJECT_POST_INVALID,
+    "created_time": "2019-05-20T00:12:34-07:00",
+}
+MOCK_OBJECT_GET = {
+    **MOCK_OBJECT_GET_INVALID,
+    "created_time": "2019-05-20T00:12:34-07:00",
+}
@@ -0,0 +1,182 @@
+"""Unit tests for asynchronous DRS client."""
+
+import asyncio
+from unittest import mock
+
+import pytest
+import requests
+
+aiohttp = pytest.importorskip("aiohttp")
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from drs_cli.async_client import AsyncDRSClient
+from drs_cli.client import DRSClient
+from drs_cli.errors import (
+    InvalidObjectData,
+    InvalidResponseError,
+)
+from drs_cli.models import (AccessURL, DrsObject, Error)
+from tests.mock_data import (
+    MOCK_ACCESS_URL,
+    MOCK_ERROR,
+    MOCK_ID,
+    MOCK_OBJECT_GET,
+    MOCK_OBJECT_POST,
+    MOCK_OBJECT_POST_INVALID,
+    MOCK_TOKEN,
+)
+
+
+def _get_app() -> web.Application:
+    """Build mock DRS app; objects with IDs starting with `x` do not exist,
+    objects with IDs starting with `y` return invalid responses.
+    """
+    async def get_object(request):
+        if request.match_info['object_id'].startswith('x'):
+            return web.json_response(MOCK_ERROR, status=404)
+        if request.match_info['object_id'].startswith('y'):
+            return web.Response(text="mock_text", status=200)
+        return web.json_response(MOCK_OBJECT_GET)
+
+    async def get_access_url(request):
+        return web.json_response(MOCK_ACCESS_URL)
+
+    async def post_object(request):
+        assert (await request.json()) == MOCK_OBJECT_POST
+        return web.json_response(request.headers['Authorization'])
+
+    async def delete_object(request):
+        return web.json_response(request.match_info['object_id'])
+
+    app = web.Application()
+    app.router.add_get('/ga4gh/drs/v1/objects/{object_id}', get_object)
+    app.router.add_get(
+        '/ga4gh/drs/v1/objects/{object_id}/access/{access_id}',
+        get_access_url,
+    )
+    app.router.add_post('/ga4gh/drs/v1/objects', post_object)
+    app.router.add_delete('/ga4gh/drs/v1/objects/{object_id}', delete_object)
+    return app
+
+
+def _run_until_complete(coro):
+    """Run coroutine in a new event loop."""
+    loop = asyncio.new_event_loop()
+    try:
+        return loop.run_until_complete(coro)
+    finally:
+        loop.close()
+
+
+def _run(test):
+    """Run test coroutine against mock DRS app."""
+    async def _test():
+        async with TestServer(_get_app()) as server:
+            async with AsyncDRSClient(
+                uri=f"http://{server.host}",
+                port=server.port,
+            ) as cli:
+                await test(cli)
+    _run_until_complete(_test())
+
+
+def test_get_object():
+    """Test get_object"""
+    async def test(cli):
+        assert isinstance(await cli.get_object(object_id=MOCK_ID), DrsObject)
+        assert isinstance(await cli.get_object(object_id='x'), Error)
+        with pytest.raises(InvalidResponseError):
+            await cli.get_object(object_id='y')
+    _run(test)
+
+
+def test_get_objects():
+    """Test concurrent retrieval of objects"""
+    async def test(cli):
+        responses = await cli.get_objects(
+            object_ids=[MOCK_ID, 'x', 'y', MOCK_ID],
+            concurrency=2,
+        )
+        assert isinstance(responses[0], DrsObject)
+        assert isinstance(responses[1], Error)
+        assert isinstance(responses[2], InvalidResponseError)
+        assert isinstance(responses[3], DrsObject)
+        with pytest.raises(ValueError):
+            await cli.get_objects(object_ids=[MOCK_ID], concurrency=0)
+    _run(test)
+
+
+def test_get_access_url():
+    """Test get_access_url"""
+    async def test(cli):
+        response = await cli.get_access_url(
+            object_id=MOCK_ID,
+            access_id=MOCK_ID,
+        )
+        assert isinstance(response, AccessURL)
+    _run(test)
+
+
+def test_post_object():
+    """Test post_object with token"""
+    async def test(cli):
+        response = await cli.post_object(
+            object_data=MOCK_OBJECT_POST,
+            token=MOCK_TOKEN,
+        )
+        assert response == f"Bearer {MOCK_TOKEN}"
+        with pytest.raises(InvalidObjectData):
+            await cli.post_object(object_data=MOCK_OBJECT_POST_INVALID)
+    _run(test)
+
+
+def test_set_token():
+    """Test token is sent along without relying on session default headers"""
+    async def test(cli):
+        with mock.patch.object(
+            aiohttp.ClientSession,
+            'headers',
+            new_callable=mock.PropertyMock,
+            side_effect=AttributeError,
+        ):
+            response = await cli.post_object(
+                object_data=MOCK_OBJECT_POST,
+                token=MOCK_TOKEN,
+            )
+        assert response == f"Bearer {MOCK_TOKEN}"
+        assert cli.headers['Authorization'] == f"Bearer {MOCK_TOKEN}"
+        cli.set_token(token=None)
+        assert 'Authorization' not in cli.headers
+    _run(test)
+
+
+def test_delete_object():
+    """Test delete_object"""
+    async def test(cli):
+        assert await cli.delete_object(object_id=MOCK_ID) == MOCK_ID
+    _run(test)
+
+
+def test_connection_error():
+    """Test connection error"""
+    async def test():
+        async with AsyncDRSClient(uri="http://0.0.0.0", port=1) as cli:
+            with pytest.raises(requests.exceptions.ConnectionError):
+                await cli.get_object(object_id=MOCK_ID)
+    _run_until_complete(test())
+
+
+def test_context_manager():
+    """Test client cannot be used as synchronous context manager"""
+    with pytest.raises(TypeError):
+        with AsyncDRSClient(uri="http://0.0.0.0"):
+            pass
+
+
+def test_client_type():
+    """Test client does not inherit synchronous request handling"""
+    cli = AsyncDRSClient(uri="http://0.0.0.0")
+    assert not isinstance(cli, DRSClient)
+    assert not hasattr(cli, '_request')
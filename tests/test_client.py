@@ -1,17 +1,25 @@
 """Unit tests for DRS client."""
 
+from http.server import (BaseHTTPRequestHandler, HTTPServer)
 import json
+import os
+import re
 import socket
-import unittest
+import ssl
+import threading
+from unittest import mock
 
 import pytest
 import requests
 import requests_mock
+import urllib3
 
-from drs_cli.client import DRSClient
+from drs_cli.client import (DRSClient, _get_ssl_context)
+from drs_cli.models import (AccessURL, DrsObject, Error)
 from drs_cli.errors import (
     InvalidResponseError,
     InvalidObjectData,
+    InvalidObjectIdentifier,
     InvalidURI
 )
 from tests.mock_data import (
@@ -24,349 +32,533 @@ from tests.mock_data import (
     MOCK_ERROR,
     MOCK_HOST,
     MOCK_ID,
+    MOCK_OBJECT_ACCESS_URL,
     MOCK_OBJECT_GET,
     MOCK_OBJECT_GET_INVALID,
     MOCK_OBJECT_POST,
     MOCK_OBJECT_POST_INVALID,
+    MOCK_OBJECT_URL,
     MOCK_PORT,
     MOCK_TOKEN,
 )
 
 
-class TestDRSClient(unittest.TestCase):
+# endpoint access method: HTTP method, request URL, method arguments
+ENDPOINTS = {
+    'get_object': (
+        'GET',
+        MOCK_OBJECT_URL,
+        {'object_id': MOCK_ID},
+    ),
+    'get_access_url': (
+        'GET',
+        MOCK_OBJECT_ACCESS_URL,
+        {'object_id': MOCK_ID, 'access_id': MOCK_ID},
+    ),
+    'post_object': (
+        'POST',
+        MOCK_DRS_URL,
+        {'object_data': MOCK_OBJECT_POST},
+    ),
+    'delete_object': (
+        'DELETE',
+        MOCK_OBJECT_URL,
+        {'object_id': MOCK_ID},
+    ),
+}
+CONNECTION_ERROR = requests.exceptions.ConnectionError
+# endpoint access method, mock response, expected return type or exception
+CRUD_CASES = [
+    ('get_object', {'json': MOCK_OBJECT_GET}, DrsObject),
+    ('get_object', {'status_code': 404, 'json': MOCK_ERROR}, Error),
+    ('get_object', {'exc': CONNECTION_ERROR}, CONNECTION_ERROR),
+    ('get_object', {'status_code': 404, 'text': "mock_text"},
+        InvalidResponseError),
+    ('get_object', {'json': MOCK_OBJECT_GET_INVALID}, InvalidResponseError),
+    ('get_access_url', {'json': MOCK_ACCESS_URL}, AccessURL),
+    ('get_access_url', {'status_code': 404, 'json': MOCK_ERROR}, Error),
+    ('get_access_url', {'exc': CONNECTION_ERROR}, CONNECTION_ERROR),
+    ('get_access_url', {'status_code': 404, 'text': "mock_text"},
+        InvalidResponseError),
+    ('get_access_url', {'json': MOCK_OBJECT_GET_INVALID},
+        InvalidResponseError),
+    ('post_object', {'json': MOCK_ID}, str),
+    ('post_object', {'status_code': 400, 'json': MOCK_ERROR}, Error),
+    ('post_object', {'exc': socket.gaierror}, CONNECTION_ERROR),
+    ('post_object', {'status_code': 404, 'text': "mock_text"},
+        InvalidResponseError),
+    ('post_object', {'text': "mock_text"}, InvalidResponseError),
+    ('delete_object', {'json': MOCK_ID}, str),
+    ('delete_object', {'status_code': 400, 'json': MOCK_ERROR}, Error),
+    ('delete_object', {'exc': CONNECTION_ERROR}, CONNECTION_ERROR),
+    ('delete_object', {'status_code': 404, 'text': "mock_text"},
+        InvalidResponseError),
+    ('delete_object', {'text': "mock_text"}, InvalidResponseError),
+]
+
+
+# self-signed certificate for 127.0.0.1
+MOCK_CA_CERT = os.path.join(os.path.dirname(__file__), 'certs', 'cert.pem')
+MOCK_CA_KEY = os.path.join(os.path.dirname(__file__), 'certs', 'key.pem')
+
+
+class _ObjectHandler(BaseHTTPRequestHandler):
+    """Respond to any `GET` request with a mock DRS object."""
+
+    def do_GET(self):
+        body = json.dumps(MOCK_OBJECT_GET).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def https_port(_mocker):
+    """Serve mock DRS objects via HTTPS, with a self-signed certificate."""
+    server = HTTPServer(('127.0.0.1', 0), _ObjectHandler)
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(certfile=MOCK_CA_CERT, keyfile=MOCK_CA_KEY)
+    server.socket = context.wrap_socket(server.socket, server_side=True)
+    threading.Thread(
+        target=server.serve_forever,
+        kwargs={'poll_interval': 0.01},
+        daemon=True,
+    ).start()
+    _mocker.register_uri(
+        requests_mock.ANY,
+        re.compile(f"^https://127.0.0.1:{server.server_port}/"),
+        real_http=True,
+    )
+    yield server.server_port
+    server.shutdown()
+    server.server_close()
+
+
+def _get_https_client(port: int) -> DRSClient:
+    """Build client for local HTTPS server that ignores CA bundles set in the
+    environment and does not back off between retries."""
+    cli = DRSClient(uri="https://127.0.0.1", port=port)
+    cli._session.trust_env = False
+    adapter = cli._session.get_adapter(cli.uri)
+    adapter.max_retries = adapter.max_retries.new(backoff_factor=0)
+    return cli
+
 
+def test_cli():
+    """Test url attribute"""
     cli = DRSClient(
         uri=MOCK_HOST,
         port=MOCK_PORT,
+        base_path=MOCK_BASE_PATH,
     )
-    cli_t = DRSClient(
-        uri=MOCK_HOST,
-        port=MOCK_PORT,
-        token=MOCK_TOKEN,
+    assert cli.uri == f"{MOCK_HOST}:{MOCK_PORT}/{MOCK_BASE_PATH}"
+    cli = DRSClient(
+        uri=MOCK_DRS_URI,
+        base_path=MOCK_BASE_PATH
     )
+    assert cli.uri == f"{MOCK_HOST}:443/{MOCK_BASE_PATH}"
 
-    def test_cli(self):
-        """Test url attribute"""
+    with pytest.raises(InvalidURI):
         cli = DRSClient(
-            uri=MOCK_HOST,
-            port=MOCK_PORT,
-            base_path=MOCK_BASE_PATH,
-        )
-        self.assertEqual(
-            cli.uri,
-            f"{MOCK_HOST}:{MOCK_PORT}/{MOCK_BASE_PATH}",
+            uri=MOCK_DRS_URI_INVALID,
+            base_path=MOCK_BASE_PATH
         )
+
+    with pytest.raises(InvalidURI):
         cli = DRSClient(
-            uri=MOCK_DRS_URI,
+            uri=MOCK_DRS_URI_LONG,
             base_path=MOCK_BASE_PATH
         )
-        self.assertEqual(
-            cli.uri,
-            f"{MOCK_HOST}:443/{MOCK_BASE_PATH}"
-        )
-
-        with pytest.raises(InvalidURI):
-            cli = DRSClient(
-                uri=MOCK_DRS_URI_INVALID,
-                base_path=MOCK_BASE_PATH
-            )
-
-        with pytest.raises(InvalidURI):
-            cli = DRSClient(
-                uri=MOCK_DRS_URI_LONG,
-                base_path=MOCK_BASE_PATH
-            )
-            print(MOCK_DRS_URI_LONG)
-
-    def test_get_object(self):
-        """Test get_object url"""
-        with requests_mock.Mocker() as m:
-            m.get(
-                f"{self.cli.uri}/objects/{MOCK_ID}",
-                status_code=200,
-                json=MOCK_OBJECT_GET,
-            )
-            self.cli.get_object(object_id=MOCK_ID)
-            self.assertEqual(
-                m.last_request.url,
-                f"{MOCK_DRS_URL}/{MOCK_ID}",
-            )
-
-            m.get(
-                f"{self.cli.uri}/objects/{MOCK_ID}",
-                status_code=404,
-                json=MOCK_ERROR,
-            )
-            self.cli.get_object(object_id=MOCK_ID)
-            self.assertEqual(
-                m.last_request.url,
-                f"{MOCK_DRS_URL}/{MOCK_ID}"
-            )
-
-            m.get(
-                f"{self.cli.uri}/objects/{MOCK_ID}",
-                exc=requests.exceptions.ConnectionError
-            )
-            with pytest.raises(requests.exceptions.ConnectionError):
-                self.cli.get_object(object_id=MOCK_ID)
-
-            m.get(
-                f"{self.cli.uri}/objects/{MOCK_ID}",
-                status_code=404,
-                text="mock_text",
-            )
-            with pytest.raises(InvalidResponseError):
-                self.cli.get_object(object_id=MOCK_ID)
-
-            m.get(
-                f"{self.cli.uri}/objects/{MOCK_ID}",
-                status_code=200,
-                json=MOCK_OBJECT_GET_INVALID,
-            )
-            with pytest.raises(InvalidResponseError):
-                self.cli.get_object(object_id=MOCK_ID)
-
-    def test_get_object_token(self):
-        """Test get_object url with token"""
-        with requests_mock.Mocker() as m:
-            m.get(
-                f"{self.cli_t.uri}/objects/{MOCK_ID}",
-                status_code=200,
-                json=MOCK_OBJECT_GET,
-            )
-            self.cli_t.get_object(
-                object_id=MOCK_ID,
-                token=MOCK_TOKEN,
-            )
-            self.assertEqual(
-                m.last_request.url,
-                f"{MOCK_DRS_URL}/{MOCK_ID}",
-            )
-
-    def test_get_access_url(self):
-        """Test get_access_url"""
-        with requests_mock.Mocker() as m:
-            m.get(
-                f"{self.cli.uri}/objects/{MOCK_ID}/access/{MOCK_ID}",
-                status_code=200,
-                json=MOCK_ACCESS_URL,
-            )
-            self.cli.get_access_url(
-                object_id=MOCK_ID,
-                access_id=MOCK_ID,
-            )
-            self.assertEqual(
-                m.last_request.url,
-                f"{MOCK_DRS_URL}/{MOCK_ID}/access/{MOCK_ID}",
-            )
-            m.get(
-                f"{self.cli.uri}/objects/{MOCK_ID}/access/{MOCK_ID}",
-                status_code=404,
-                json=MOCK_ERROR,
-            )
-            self.cli.get_access_url(
-                object_id=MOCK_ID,
-                access_id=MOCK_ID,
-            )
-            self.assertEqual(
-                m.last_request.url,
-                f"{MOCK_DRS_URL}/{MOCK_ID}/access/{MOCK_ID}",
-            )
+        print(MOCK_DRS_URI_LONG)
 
-            m.get(
-                f"{self.cli.uri}/objects/{MOCK_ID}/access/{MOCK_ID}",
-                exc=requests.exceptions.ConnectionError
-            )
-            with pytest.raises(requests.exceptions.ConnectionError):
-                self.cli.get_access_url(
-                    object_id=MOCK_ID,
-                    access_id=MOCK_ID,
-                )
-
-            m.get(
-                f"{self.cli.uri}/objects/{MOCK_ID}/access/{MOCK_ID}",
-                status_code=404,
-                text="mock_text",
-            )
-            with pytest.raises(InvalidResponseError):
-                self.cli.get_access_url(
-                    object_id=MOCK_ID,
-                    access_id=MOCK_ID,
-                )
-
-            m.get(
-                f"{self.cli.uri}/objects/{MOCK_ID}/access/{MOCK_ID}",
-                status_code=200,
-                json=MOCK_OBJECT_GET_INVALID,
-            )
-            with pytest.raises(InvalidResponseError):
-                self.cli.get_access_url(
-                    object_id=MOCK_ID,
-                    access_id=MOCK_ID,
-                )
-
-    def test_get_access_url_token(self):
-        """Test get_access_url url with token"""
-        with requests_mock.Mocker() as m:
-            m.get(
-                f"{self.cli_t.uri}/objects/{MOCK_ID}/access/{MOCK_ID}",
-                status_code=200,
-                json=MOCK_ACCESS_URL,
-            )
-            self.cli_t.get_access_url(
-                object_id=MOCK_ID,
-                access_id=MOCK_ID,
-                token=MOCK_TOKEN,
-            )
-            self.assertEqual(
-                m.last_request.url,
-                f"{MOCK_DRS_URL}/{MOCK_ID}/access/{MOCK_ID}",
-            )
-
-    def test_post_object(self):
-        """Test post_object url"""
-        with requests_mock.Mocker() as m:
-            m.post(
-                f"{self.cli.uri}/objects",
-                status_code=200,
-                json=MOCK_ID,
-            )
-            json_string = json.dumps(MOCK_OBJECT_POST)
-            json_data = json.loads(json_string)
-            self.cli.post_object(json_data)
-            self.assertEqual(
-                m.last_request.url,
-                f"{MOCK_DRS_URL}",
-            )
-
-            m.post(
-                f"{self.cli.uri}/objects",
-                status_code=400,
-                json=MOCK_ERROR,
-            )
-            json_string = json.dumps(MOCK_OBJECT_POST)
-            json_data = json.loads(json_string)
-            self.cli.post_object(json_data)
-            self.assertEqual(
-                m.last_request.url,
-                f"{MOCK_DRS_URL}",
-            )
+    with pytest.raises(InvalidURI):
+        cli = DRSClient(
+            uri=f"drs://{'a' * 3000}.com/SOME_OBJECT",
+        )
 
-            m.post(
-                f"{self.cli.uri}/objects",
-                status_code=200,
-                json=MOCK_ID,
-            )
-            json_string = json.dumps(MOCK_OBJECT_POST_INVALID)
-            json_data = json.loads(json_string)
-            with pytest.raises(InvalidObjectData):
-                self.cli.post_object(json_data)
-
-            m.post(
-                f"{self.cli.uri}/objects",
-                exc=socket.gaierror
-            )
-            json_string = json.dumps(MOCK_OBJECT_POST)
-            json_data = json.loads(json_string)
-            with pytest.raises(requests.exceptions.ConnectionError):
-                self.cli.post_object(json_data)
-
-            m.post(
-                f"{self.cli.uri}/objects",
-                status_code=404,
-                text="mock_text",
-            )
-            with pytest.raises(InvalidResponseError):
-                self.cli.post_object(json_data)
+    with pytest.raises(InvalidURI):
+        cli = DRSClient(
+            uri=f"https://{'a-' * 1000}",
+        )
 
-            m.post(
-                f"{self.cli.uri}/objects",
-                status_code=200,
-                text="mock_text"
-            )
-            with pytest.raises(InvalidResponseError):
-                self.cli.post_object(json_data)
-
-    def test_post_object_token(self):
-        """Test post_object url with token"""
-        with requests_mock.Mocker() as m:
-            m.post(
-                f"{self.cli_t.uri}/objects",
-                status_code=200,
-                json=MOCK_ID,
-            )
-            json_string = json.dumps(MOCK_OBJECT_POST)
-            json_data = json.loads(json_string)
-            self.cli_t.post_object(
-                object_data=json_data,
-                token=MOCK_ID,
-            )
-            self.assertEqual(
-                m.last_request.url,
-                f"{MOCK_DRS_URL}",
-            )
 
-    def test_delete_object(self):
-        """Test delete_object url"""
-        with requests_mock.Mocker() as m:
-            m.delete(
-                f"{self.cli.uri}/objects/{MOCK_ID}",
-                status_code=200,
-                json=MOCK_ID,
-            )
-            self.cli.delete_object(object_id=MOCK_ID)
-            self.assertEqual(
-                m.last_request.url,
-                f"{MOCK_DRS_URL}/{MOCK_ID}",
-            )
+@pytest.mark.parametrize("endpoint,response,expected", CRUD_CASES)
+def test_endpoint(mocker, cli, endpoint, response, expected):
+    """Test endpoint access methods"""
+    http_method, url, kwargs = ENDPOINTS[endpoint]
+    mocker.register_uri(http_method, url, **response)
+    if issubclass(expected, Exception):
+        with pytest.raises(expected):
+            getattr(cli, endpoint)(**kwargs)
+    else:
+        assert isinstance(getattr(cli, endpoint)(**kwargs), expected)
+    assert mocker.last_request.url == url
+
+
+@pytest.mark.parametrize("endpoint", ENDPOINTS)
+def test_endpoint_token(mocker, cli_t, endpoint):
+    """Test endpoint access methods with token"""
+    http_method, url, kwargs = ENDPOINTS[endpoint]
+    mocker.register_uri(http_method, url, status_code=404, json=MOCK_ERROR)
+    getattr(cli_t, endpoint)(token=MOCK_TOKEN, **kwargs)
+    assert mocker.last_request.url == url
+    assert mocker.last_request.headers['Authorization'] == (
+        f"Bearer {MOCK_TOKEN}"
+    )
 
-            m.delete(
-                f"{self.cli.uri}/objects/{MOCK_ID}",
-                status_code=400,
-                json=MOCK_ERROR,
-            )
-            self.cli.delete_object(object_id=MOCK_ID)
-            self.assertEqual(
-                m.last_request.url,
-                f"{MOCK_DRS_URL}/{MOCK_ID}",
-            )
 
-            m.delete(
-                f"{self.cli.uri}/objects/{MOCK_ID}",
-                exc=requests.exceptions.ConnectionError
-            )
-            with pytest.raises(requests.exceptions.ConnectionError):
-                self.cli.delete_object(object_id=MOCK_ID)
+def test_post_object(mocker, cli):
+    """Test post_object payload"""
+    mocker.post(
+        MOCK_DRS_URL,
+        status_code=200,
+        json=MOCK_ID,
+    )
+    cli.post_object(MOCK_OBJECT_POST)
+    assert mocker.last_request.json() == MOCK_OBJECT_POST
+    assert (
+        mocker.last_request.headers['Content-type'] == 'application/json'
+    )
+    with pytest.raises(InvalidObjectData):
+        cli.post_object(MOCK_OBJECT_POST_INVALID)
+    with pytest.raises(InvalidObjectData):
+        cli.post_object([MOCK_OBJECT_POST])
+    assert mocker.call_count == 1
 
-            m.delete(
-                f"{self.cli.uri}/objects/{MOCK_ID}",
-                status_code=404,
-                text="mock_text",
-            )
-            with pytest.raises(InvalidResponseError):
-                self.cli.delete_object(object_id=MOCK_ID)
 
-            m.delete(
-                f"{self.cli.uri}/objects/{MOCK_ID}",
-                status_code=200,
-                text="mock_text",
-            )
-            with pytest.raises(InvalidResponseError):
-                self.cli.delete_object(object_id=MOCK_ID)
-
-    def test_delete_object_token(self):
-        """Test delete_object url with token"""
-        with requests_mock.Mocker() as m:
-            m.delete(
-                f"{self.cli_t.uri}/objects/{MOCK_ID}",
-                status_code=200,
-                json=MOCK_ID,
-            )
-            self.cli_t.delete_object(
-                object_id=MOCK_ID,
-                token=MOCK_TOKEN,
-            )
-            self.assertEqual(
-                m.last_request.url,
-                f"{MOCK_DRS_URL}/{MOCK_ID}",
-            )
+def test_session_token(mocker):
+    """Test token is sent along via session headers"""
+    cli = DRSClient(
+        uri=MOCK_HOST,
+        port=MOCK_PORT,
+    )
+    mocker.get(
+        MOCK_OBJECT_URL,
+        status_code=200,
+        json=MOCK_OBJECT_GET,
+    )
+    cli.get_object(object_id=MOCK_ID)
+    assert 'Authorization' not in mocker.last_request.headers
+    cli.get_object(
+        object_id=MOCK_ID,
+        token=MOCK_TOKEN,
+    )
+    assert mocker.last_request.headers['Authorization'] == (
+        f"Bearer {MOCK_TOKEN}"
+    )
+    cli.set_token(token=None)
+    cli.get_object(object_id=MOCK_ID)
+    assert cli.token is None
+    assert 'Authorization' not in mocker.last_request.headers
+    cli.headers['X-Custom'] = 'mock'
+    cli.get_object(object_id=MOCK_ID)
+    assert mocker.last_request.headers['X-Custom'] == 'mock'
+    assert cli.headers is cli._session.headers
+
+
+def test_context_manager():
+    """Test client closes its session on exit"""
+    with DRSClient(uri=MOCK_HOST, port=MOCK_PORT) as cli:
+        assert isinstance(cli, DRSClient)
+        cli._session.close = mock.Mock()
+    cli._session.close.assert_called_once_with()
+
+
+def test_get_object_id_cached(cli):
+    """Test object ID parsing is cached"""
+    DRSClient._get_object_id.cache_clear()
+    cli._get_object_id(object_id=MOCK_DRS_URI)
+    cli._get_object_id(object_id=MOCK_DRS_URI)
+    assert DRSClient._get_object_id.cache_info().hits == 1
+
+
+def test_get_object_cached(mocker):
+    """Test responses of get_object are cached"""
+    cli = DRSClient(
+        uri=MOCK_HOST,
+        port=MOCK_PORT,
+        cache_ttl=60,
+    )
+    mocker.get(
+        MOCK_OBJECT_URL,
+        status_code=200,
+        json=MOCK_OBJECT_GET,
+    )
+    mocker.delete(
+        MOCK_OBJECT_URL,
+        status_code=200,
+        json=MOCK_ID,
+    )
+    expected = DrsObject.parse_obj(MOCK_OBJECT_GET)
+    response = cli.get_object(object_id=MOCK_ID)
+    response.aliases = ['changed']
+    cached = cli.get_object(object_id=MOCK_ID)
+    assert mocker.call_count == 1
+    assert cached == expected
+    cached.checksums[0].checksum = 'changed'
+    assert cli.get_object(object_id=MOCK_ID) == expected
+    cli.get_object(
+        object_id=MOCK_ID,
+        token=MOCK_TOKEN,
+    )
+    assert mocker.call_count == 2
+    cli.delete_object(object_id=MOCK_ID)
+    cli.get_object(object_id=MOCK_ID)
+    assert mocker.call_count == 4
+
+
+def test_get_object_cached_no_cachetools():
+    """Test caching requires cachetools, while clients without cache do not"""
+    with mock.patch('drs_cli.client.TTLCache', None):
+        DRSClient(uri=MOCK_HOST, port=MOCK_PORT)
+        with pytest.raises(ImportError):
+            DRSClient(uri=MOCK_HOST, port=MOCK_PORT, cache_ttl=60)
+
+
+def test_get_objects(mocker, cli):
+    """Test concurrent retrieval of objects"""
+    mocker.get(
+        MOCK_OBJECT_URL,
+        status_code=200,
+        json=MOCK_OBJECT_GET,
+    )
+    mocker.get(
+        f"{MOCK_DRS_URL}/x",
+        status_code=404,
+        json=MOCK_ERROR,
+    )
+    mocker.get(
+        f"{MOCK_DRS_URL}/y",
+        exc=requests.exceptions.ConnectionError,
+    )
+    responses = cli.get_objects(
+        object_ids=[MOCK_ID, 'x', 'y', MOCK_ID],
+        max_workers=2,
+    )
+    assert mocker.call_count == 4
+    assert isinstance(responses[0], DrsObject)
+    assert isinstance(responses[1], Error)
+    assert isinstance(responses[2], requests.exceptions.ConnectionError)
+    assert isinstance(responses[3], DrsObject)
+    assert cli.get_objects(object_ids=[]) == []
+
+
+def test_session_retries(cli):
+    """Test only idempotent requests are retried"""
+    retry = cli._session.get_adapter(cli.uri).max_retries
+    assert retry.is_retry('GET', status_code=503)
+    assert retry.is_retry('DELETE', status_code=502)
+    assert not retry.is_retry('POST', status_code=503)
+    assert not retry.is_retry('GET', status_code=404)
+
+
+def test_session_retries_server_errors(mocker):
+    """Test GET requests are retried on transient server errors, while POST
+    requests are not"""
+    statuses = {'GET': [503, 503, 200], 'POST': [503, 200]}
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def respond(self):
+            status = statuses[self.command].pop(0)
+            body = json.dumps(
+                MOCK_OBJECT_GET if status == 200 else MOCK_ERROR
+            ).encode()
+            self.rfile.read(int(self.headers.get('Content-Length', 0)))
+            self.send_response(status)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        do_GET = do_POST = respond
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(
+        target=server.serve_forever,
+        kwargs={'poll_interval': 0.01},
+        daemon=True,
+    ).start()
+    mocker.register_uri(
+        requests_mock.ANY,
+        re.compile(f"^http://127.0.0.1:{server.server_port}/"),
+        real_http=True,
+    )
+    with DRSClient(
+        uri="http://127.0.0.1",
+        port=server.server_port,
+    ) as cli:
+        adapter = cli._session.get_adapter(cli.uri)
+        adapter.max_retries = adapter.max_retries.new(backoff_factor=0)
+        assert isinstance(cli.get_object(object_id=MOCK_ID), DrsObject)
+        assert isinstance(cli.post_object(MOCK_OBJECT_POST), Error)
+    server.shutdown()
+    server.server_close()
+    assert statuses == {'GET': [], 'POST': [200]}
+
+
+def test_parse_response_decodes_once():
+    """Test response body is decoded exactly once"""
+    with mock.patch(
+        'drs_cli.client.json_loads',
+        wraps=json.loads,
+    ) as json_loads:
+        response = DRSClient._parse_response(
+            status_code=404,
+            content=json.dumps(MOCK_ERROR).encode(),
+            success_model=DrsObject,
+        )
+        assert isinstance(response, Error)
+        response = DRSClient._parse_response(
+            status_code=200,
+            content=json.dumps(MOCK_OBJECT_GET).encode(),
+            success_model=DrsObject,
+        )
+        assert isinstance(response, DrsObject)
+        assert json_loads.call_count == 2
+
+
+def test_get_object_large(mocker, cli):
+    """Test get_object with large response body"""
+    large_object = dict(MOCK_OBJECT_GET)
+    large_object['aliases'] = ['a' * 1024] * 200
+    content = json.dumps(large_object).encode()
+    mocker.get(
+        MOCK_OBJECT_URL,
+        status_code=200,
+        content=content,
+        headers={'Content-Length': str(len(content))},
+    )
+    response = cli.get_object(object_id=MOCK_ID)
+    assert response.aliases == large_object['aliases']
+
+
+def test_get_object_large_truncated(mocker):
+    """Test get_object with truncated large response body"""
+
+    class Handler(BaseHTTPRequestHandler):
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header(
+                'Content-Length',
+                str(DRSClient._STREAM_THRESHOLD + 1),
+            )
+            self.end_headers()
+            self.wfile.write(json.dumps(MOCK_OBJECT_GET).encode())
+            self.close_connection = True
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Handler)
+    threading.Thread(
+        target=server.serve_forever,
+        kwargs={'poll_interval': 0.01},
+        daemon=True,
+    ).start()
+    mocker.register_uri(
+        requests_mock.ANY,
+        re.compile(f"^http://127.0.0.1:{server.server_port}/"),
+        real_http=True,
+    )
+    with DRSClient(
+        uri="http://127.0.0.1",
+        port=server.server_port,
+    ) as cli:
+        with pytest.raises(requests.exceptions.ChunkedEncodingError):
+            cli.get_object(object_id=MOCK_ID)
+    server.shutdown()
+    server.server_close()
+
+
+def test_session_ssl_context(cli):
+    """Test sessions share a single SSL context for default verification"""
+    for client in (cli, DRSClient(uri=MOCK_HOST)):
+        adapter = client._session.get_adapter(client.uri)
+        pool_kw = adapter.poolmanager.connection_pool_kw
+        assert pool_kw['ssl_context'] is _get_ssl_context()
+    proxy_manager = adapter.proxy_manager_for('http://proxy.fake:3128')
+    assert proxy_manager.connection_pool_kw['ssl_context'] is (
+        _get_ssl_context()
+    )
+    conn = mock.Mock(conn_kw={})
+    adapter.cert_verify(conn, MOCK_HOST, True, None)
+    assert conn.conn_kw['ssl_context'] is _get_ssl_context()
+    assert conn.cert_reqs == 'CERT_REQUIRED'
+    assert conn.ca_certs is None
+    for verify, cert in (
+        (False, None),
+        (MOCK_CA_CERT, None),
+        (True, (MOCK_CA_CERT, MOCK_CA_KEY)),
+    ):
+        conn = mock.Mock(conn_kw={'ssl_context': _get_ssl_context()})
+        adapter.cert_verify(conn, MOCK_HOST, verify, cert)
+        assert 'ssl_context' not in conn.conn_kw
+    assert conn.ca_certs is not None
+
+
+def test_session_ssl_verify_disabled(https_port):
+    """Test requests without certificate verification"""
+    with _get_https_client(port=https_port) as cli:
+        cli._session.verify = False
+        with pytest.warns(urllib3.exceptions.InsecureRequestWarning):
+            response = cli.get_object(object_id=MOCK_ID)
+    assert isinstance(response, DrsObject)
+
+
+def test_session_ssl_custom_ca(https_port):
+    """Test custom CA certificates are not trusted by other clients"""
+    with _get_https_client(port=https_port) as cli:
+        cli._session.verify = MOCK_CA_CERT
+        assert isinstance(cli.get_object(object_id=MOCK_ID), DrsObject)
+    with _get_https_client(port=https_port) as cli:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            cli.get_object(object_id=MOCK_ID)
+
+
+def test_get_object_id(cli):
+    """Test extraction of object IDs from DRS URIs"""
+    assert cli._get_object_id(object_id=MOCK_DRS_URI) == "SOME_OBJECT"
+    object_id = cli._get_object_id(
+        object_id="drs://fakehost.com/a/b",
+    )
+    assert object_id == "a%2Fb"
+    assert cli._get_object_id(object_id=MOCK_ID) == MOCK_ID
+    for object_id in (
+        "",
+        "a b",
+        "drs://fakehost.com/a b",
+        f"drs://{'a' * 3000}.com/SOME_OBJECT",
+    ):
+        with pytest.raises(InvalidObjectIdentifier):
+            cli._get_object_id(object_id=object_id)
+
+
+def test_token_unchanged(mocker):
+    """Test headers are only updated if the token changes"""
+    cli = DRSClient(
+        uri=MOCK_HOST,
+        port=MOCK_PORT,
+        token=MOCK_TOKEN,
+    )
+    mocker.get(
+        MOCK_OBJECT_URL,
+        status_code=200,
+        json=MOCK_OBJECT_GET,
+    )
+    with mock.patch.object(DRSClient, 'set_token') as set_token:
+        cli.get_object(
+            object_id=MOCK_ID,
+            token=MOCK_TOKEN,
+        )
+        set_token.assert_not_called()
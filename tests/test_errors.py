@@ -1,40 +1,46 @@
 """Unit tests for errors/handlers."""
 
+import logging
 import sys
 
 import pytest
 
-from drs_cli.errors import exception_handler
+from drs_cli.errors import (
+    configure_excepthook,
+    exception_handler,
+)
 from tests.mock_data import (
     MOCK_ERROR_MSG,
     MOCK_ERROR_MSG_CUSTOM_HANDLER,
 )
 
 
-def test_exception_handler():
-    sys.excepthook = sys.__excepthook__
-    with pytest.raises(Exception) as e:
-        raise Exception(MOCK_ERROR_MSG)
-        assert str(e.value) == MOCK_ERROR_MSG
-
-    test_handler = exception_handler(
-        _type=Exception,
-        value=Exception(MOCK_ERROR_MSG_CUSTOM_HANDLER),
-        traceback=sys.exc_info()[2],
-    )
-    sys.excepthook = test_handler
-    with pytest.raises(Exception) as e:
-        raise Exception(MOCK_ERROR_MSG)
-        assert str(e.value) == MOCK_ERROR_MSG_CUSTOM_HANDLER
-
-    test_handler_no_msg = exception_handler(
-        _type=Exception,
-        value=Exception(),
-        traceback=sys.exc_info()[2],
-    )
-    sys.excepthook = test_handler_no_msg
-    with pytest.raises(Exception) as e:
-        raise Exception(MOCK_ERROR_MSG_CUSTOM_HANDLER)
-        assert str(e.value) is None
-
-    sys.excepthook = sys.__excepthook__
+@pytest.fixture(autouse=True)
+def excepthook():
+    """Restore handler for uncaught exceptions after each test."""
+    previous = sys.excepthook
+    yield
+    sys.excepthook = previous
+
+
+@pytest.mark.parametrize("exc,expected", [
+    (Exception(MOCK_ERROR_MSG), f"Exception: {MOCK_ERROR_MSG}"),
+    (
+        ValueError(MOCK_ERROR_MSG_CUSTOM_HANDLER),
+        f"ValueError: {MOCK_ERROR_MSG_CUSTOM_HANDLER}",
+    ),
+    (Exception(), "Exception"),
+])
+def test_exception_handler(caplog, exc, expected):
+    with caplog.at_level(logging.ERROR, logger='drs_cli.errors'):
+        exception_handler(
+            _type=type(exc),
+            value=exc,
+            traceback=None,
+        )
+    assert caplog.messages == [expected]
+
+
+def test_configure_excepthook():
+    configure_excepthook()
+    assert sys.excepthook is exception_handler